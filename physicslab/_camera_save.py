@@ -1,9 +1,9 @@
 """Camera state serialisation for Physics-Lab-AR save files."""
 
-import json
 from enum import Enum, unique
 from physicslab._typing import num_type
 from physicslab import coordinate_system
+from physicslab._experiment import serialize_json_in_plsav
 
 
 @unique
@@ -18,6 +18,8 @@ class CameraMode(Enum):
 class CameraSave:
     """Camera state persisted inside a Physics-Lab-AR ``.plsav`` file."""
 
+    __slots__ = ("__camera_mode", "__distance", "__vision_center", "__target_rotation")
+
     __camera_mode: CameraMode
     __distance: num_type
     __vision_center: coordinate_system.Position
@@ -102,4 +104,4 @@ class CameraSave:
 
     def as_str_in_plsav(self) -> str:
         """Serialise the camera state to a JSON string for use in a ``.plsav`` file."""
-        return json.dumps(self.as_dict())
+        return serialize_json_in_plsav(self.as_dict())
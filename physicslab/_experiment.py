@@ -1,10 +1,19 @@
+import json
 from physicslab import enums
-from physicslab._typing import Set, List, Optional, Union
+from physicslab._typing import Set, List, Optional, Union, Any
 
 TYPE_TAG_CIRCUIT = "Type-0"
 TYPE_TAG_CELESTIAL = "Type-3"
 TYPE_TAG_ELECTROMAGNETISM = "Type-4"
 
+# Physics-Lab-AR writes the StatusSave / CameraSave strings without whitespace
+_PLSAV_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def serialize_json_in_plsav(obj: Any) -> str:
+    """Serialise *obj* to the compact JSON string embedded in a ``.plsav`` file."""
+    return _PLSAV_JSON_ENCODER.encode(obj)
+
 
 def serialize_introduction(introduction: Optional[str]) -> Optional[list[str]]:
     """Convert introduction text to the ``Summary.Description`` save format."""
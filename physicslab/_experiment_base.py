@@ -0,0 +1,95 @@
+"""Behaviour shared by the circuit, celestial and electromagnetism experiments."""
+
+import abc
+import json
+import pathlib
+from physicslab import enums
+from physicslab._camera_save import CameraSave
+from physicslab._summary import Summary
+from physicslab._typing import Optional, Self, Set
+
+
+class ExperimentBase:
+    """Camera state, summary and file output common to every experiment type."""
+
+    __slots__ = ("__camera_save", "__summary")
+
+    __camera_save: CameraSave
+    __summary: Summary
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+    @property
+    def name(self) -> Optional[str]:
+        """Display name of this experiment (may be ``None``)."""
+        return self.summary.subject
+
+    @name.setter
+    def name(self, name: Optional[str]) -> None:
+        self.summary.subject = name
+
+    @property
+    def camera_save(self) -> CameraSave:
+        """Camera state saved with this experiment."""
+        return self.__camera_save
+
+    @camera_save.setter
+    def camera_save(self, camera_save: CameraSave) -> None:
+        if not isinstance(camera_save, CameraSave):
+            raise TypeError(
+                f"camera_save must be of type `CameraSave`, but got value {camera_save} of type {type(camera_save).__name__}"
+            )
+
+        self.__camera_save = camera_save
+
+    @property
+    def introduction(self) -> Optional[str]:
+        """Introduction of this experiment (may be ``None``)."""
+        return self.summary.description
+
+    @introduction.setter
+    def introduction(self, introduction: Optional[str]) -> None:
+        self.summary.description = introduction
+
+    @property
+    def tags(self) -> Set[enums.Tag]:
+        """Community tags of this experiment."""
+        return self.summary.tags
+
+    @tags.setter
+    def tags(self, tags: Set[enums.Tag]) -> None:
+        self.summary.tags = tags
+
+    @property
+    def summary(self) -> Summary:
+        """Summary metadata of this experiment."""
+        return self.__summary
+
+    @summary.setter
+    def summary(self, summary: Summary) -> None:
+        if not isinstance(summary, Summary):
+            raise TypeError(
+                f"summary must be of type `Summary`, but got value {summary} of type {type(summary).__name__}"
+            )
+        self.__summary = summary
+
+    @abc.abstractmethod
+    def as_plsav_dict(self) -> dict:
+        """Subclasses must serialise this experiment to a ``plsav`` dictionary."""
+        raise NotImplementedError(
+            "Subclasses of ExperimentBase must implement the as_plsav_dict method"
+        )
+
+    def save_to(self, path: pathlib.Path) -> None:
+        """Write this experiment to *path* as a ``.plsav`` JSON file."""
+        if not isinstance(path, pathlib.Path):
+            raise TypeError(
+                f"path must be of type `Path`, but got value {path} of type {type(path).__name__}"
+            )
+
+        with path.open("w", encoding="utf-8", newline="\n") as f:
+            json.dump(self.as_plsav_dict(), f, ensure_ascii=True)
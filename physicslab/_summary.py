@@ -12,6 +12,45 @@ from physicslab._experiment import (
 class Summary:
     """Summary information about an experiment, as displayed in Physics-Lab-AR."""
 
+    __slots__ = (
+        "__experiment_type",
+        "__subject",
+        "__description",
+        "__tags",
+        "__type_tag",
+        "__parent_id",
+        "__parent_name",
+        "__parent_category",
+        "__content_id",
+        "__editor",
+        "__coauthors",
+        "__localized_description",
+        "__model_id",
+        "__model_name",
+        "__model_tags",
+        "__version",
+        "__language",
+        "__visits",
+        "__stars",
+        "__supports",
+        "__remixes",
+        "__comments",
+        "__price",
+        "__popularity",
+        "__creation_date",
+        "__update_date",
+        "__sorting_date",
+        "__summary_id",
+        "__category",
+        "__localized_subject",
+        "__image",
+        "__image_region",
+        "__user",
+        "__visibility",
+        "__settings",
+        "__multilingual",
+    )
+
     __experiment_type: int
     __subject: Optional[str]
     __description: Optional[str]
@@ -131,7 +170,8 @@ class Summary:
 
     @experiment_type.setter
     def experiment_type(self, experiment_type: int) -> None:
-        if not isinstance(experiment_type, int):
+        # bool is a subclass of int, but True/False is never a valid type id
+        if not isinstance(experiment_type, int) or isinstance(experiment_type, bool):
             raise TypeError(
                 f"experiment_type must be of type `int`, but got value {experiment_type} of type {type(experiment_type).__name__}"
             )
@@ -477,61 +517,77 @@ class Summary:
         }
 
 
+# The ``user`` setter copies its argument, so every Summary gets its own dict
+_DEFAULT_USER: Dict[str, Any] = {
+    "ID": None,
+    "Nickname": None,
+    "Signature": None,
+    "Avatar": 0,
+    "AvatarRegion": 0,
+    "Decoration": 0,
+    "Verification": None,
+}
+
+
+def construct_default_summary(
+    experiment_type: int,
+    type_tag: str,
+    subject: Optional[str] = None,
+    description: Optional[str] = None,
+    tags: Optional[Set[enums.Tag]] = None,
+) -> Summary:
+    return Summary(
+        experiment_type=experiment_type,
+        subject=subject,
+        description=description,
+        tags=set() if tags is None else tags,
+        type_tag=type_tag,
+        parent_id=None,
+        parent_name=None,
+        parent_category=None,
+        content_id=None,
+        editor=None,
+        coauthors=[],
+        localized_description=None,
+        model_id=None,
+        model_name=None,
+        model_tags=[],
+        version=0,
+        language=None,
+        visits=0,
+        stars=0,
+        supports=0,
+        remixes=0,
+        comments=0,
+        price=0,
+        popularity=0,
+        creation_date=int(time.time() * 1000),
+        update_date=0,
+        sorting_date=0,
+        summary_id=None,
+        category=None,
+        localized_subject=None,
+        image=0,
+        image_region=0,
+        user=_DEFAULT_USER,
+        visibility=0,
+        settings={},
+        multilingual=False,
+    )
+
+
 def construct_summary_from_plsav_dict(
     summary_dict: Optional[dict],
     experiment_type: int,
     type_tag: str,
 ) -> Summary:
-    if not isinstance(experiment_type, int):
+    if not isinstance(experiment_type, int) or isinstance(experiment_type, bool):
         raise TypeError(
             f"experiment_type must be of type `int`, but got value {experiment_type} of type {type(experiment_type).__name__}"
         )
     if summary_dict is None:
-        return Summary(
-            experiment_type=experiment_type,
-            subject=None,
-            description=None,
-            tags=set(),
-            type_tag=type_tag,
-            parent_id=None,
-            parent_name=None,
-            parent_category=None,
-            content_id=None,
-            editor=None,
-            coauthors=[],
-            localized_description=None,
-            model_id=None,
-            model_name=None,
-            model_tags=[],
-            version=0,
-            language=None,
-            visits=0,
-            stars=0,
-            supports=0,
-            remixes=0,
-            comments=0,
-            price=0,
-            popularity=0,
-            creation_date=int(time.time() * 1000),
-            update_date=0,
-            sorting_date=0,
-            summary_id=None,
-            category=None,
-            localized_subject=None,
-            image=0,
-            image_region=0,
-            user={
-                "ID": None,
-                "Nickname": None,
-                "Signature": None,
-                "Avatar": 0,
-                "AvatarRegion": 0,
-                "Decoration": 0,
-                "Verification": None,
-            },
-            visibility=0,
-            settings={},
-            multilingual=False,
+        return construct_default_summary(
+            experiment_type=experiment_type, type_tag=type_tag
         )
     if not isinstance(summary_dict, dict):
         raise TypeError(
@@ -1,16 +1,29 @@
 """Save-state container for celestial experiment elements and simulation settings."""
 
 import uuid
-import json
 from physicslab import coordinate_system
 from physicslab import errors
 from physicslab._typing import List, Dict, num_type
+from physicslab._experiment import serialize_json_in_plsav
 from . import _base
 
 
 class CelestialStatusSave:
     """Manages a collection of celestial elements and their simulation settings."""
 
+    __slots__ = (
+        "__elements",
+        "__id2element",
+        "__position2element",
+        "__main_identifier",
+        "__world_time",
+        "__scaling_name",
+        "__length_scale",
+        "__size_linear",
+        "__size_nonlinear",
+        "__star_present",
+    )
+
     __elements: List[_base.CelestialBase]
     __id2element: Dict[str, _base.CelestialBase]
     __position2element: Dict[coordinate_system.Position, _base.CelestialBase]
@@ -295,4 +308,4 @@ class CelestialStatusSave:
 
     def as_str_in_plsav(self) -> str:
         """Returns the JSON string representation for embedding in a .plsav file."""
-        return json.dumps(self.as_dict())
+        return serialize_json_in_plsav(self.as_dict())
@@ -9,23 +9,27 @@ from physicslab.utils import find_path_of_sav_name
 from physicslab import coordinate_system
 from physicslab.enums import Category
 from physicslab.web import User, anonymous_login
-from physicslab._summary import Summary, construct_summary_from_plsav_dict
+from physicslab._summary import (
+    construct_default_summary,
+    construct_summary_from_plsav_dict,
+)
 from physicslab._experiment import (
     TYPE_TAG_CELESTIAL,
 )
 from . import planets
 from ._status_save import CelestialStatusSave
 from ._base import CelestialBase
-from physicslab._typing import Self, Optional, Tuple, Set
+from physicslab._typing import Self, Optional, Tuple, Set, Dict, Type
 from physicslab._camera_save import CameraMode, CameraSave
+from physicslab._experiment_base import ExperimentBase
 
 
-class CelestialExperiment:
+class CelestialExperiment(ExperimentBase):
     """Manages a celestial experiment with elements and camera settings."""
 
+    __slots__ = ("__status_save",)
+
     __status_save: CelestialStatusSave
-    __camera_save: CameraSave
-    __summary: Summary
 
     def __init__(
         self,
@@ -41,68 +45,14 @@ class CelestialExperiment:
     ) -> None:
         self.status_save = CelestialStatusSave()
         self.camera_save = camera_save
-        self.summary = Summary(
+        self.summary = construct_default_summary(
             experiment_type=3,
+            type_tag=TYPE_TAG_CELESTIAL,
             subject=name,
             description=introduction,
-            tags=set() if tags is None else tags,
-            type_tag=TYPE_TAG_CELESTIAL,
-            parent_id=None,
-            parent_name=None,
-            parent_category=None,
-            content_id=None,
-            editor=None,
-            coauthors=[],
-            localized_description=None,
-            model_id=None,
-            model_name=None,
-            model_tags=[],
-            version=0,
-            language=None,
-            visits=0,
-            stars=0,
-            supports=0,
-            remixes=0,
-            comments=0,
-            price=0,
-            popularity=0,
-            creation_date=int(time.time() * 1000),
-            update_date=0,
-            sorting_date=0,
-            summary_id=None,
-            category=None,
-            localized_subject=None,
-            image=0,
-            image_region=0,
-            user={
-                "ID": None,
-                "Nickname": None,
-                "Signature": None,
-                "Avatar": 0,
-                "AvatarRegion": 0,
-                "Decoration": 0,
-                "Verification": None,
-            },
-            visibility=0,
-            settings={},
-            multilingual=False,
+            tags=tags,
         )
 
-    def __enter__(self) -> Self:
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback) -> None:
-        pass
-
-    @property
-    def name(self) -> Optional[str]:
-        """Returns the experiment name."""
-        return self.summary.subject
-
-    @name.setter
-    def name(self, name: Optional[str]) -> None:
-        self.summary.subject = name
-
     @property
     def status_save(self) -> CelestialStatusSave:
         """Returns the status save containing all celestial elements."""
@@ -117,51 +67,6 @@ class CelestialExperiment:
 
         self.__status_save = status_save
 
-    @property
-    def camera_save(self) -> CameraSave:
-        """Returns the camera save configuration."""
-        return self.__camera_save
-
-    @camera_save.setter
-    def camera_save(self, camera_save: CameraSave) -> None:
-        if not isinstance(camera_save, CameraSave):
-            raise TypeError(
-                f"camera_save must be of type `CameraSave`, but got value {camera_save} of type {type(camera_save).__name__}"
-            )
-
-        self.__camera_save = camera_save
-
-    @property
-    def introduction(self) -> Optional[str]:
-        """Returns the experiment introduction (may be ``None``)."""
-        return self.summary.description
-
-    @introduction.setter
-    def introduction(self, introduction: Optional[str]) -> None:
-        self.summary.description = introduction
-
-    @property
-    def tags(self) -> Set[enums.Tag]:
-        """Community tags of this experiment."""
-        return self.summary.tags
-
-    @tags.setter
-    def tags(self, tags: Set[enums.Tag]) -> None:
-        self.summary.tags = tags
-
-    @property
-    def summary(self) -> Summary:
-        """Summary metadata of this experiment."""
-        return self.__summary
-
-    @summary.setter
-    def summary(self, summary: Summary) -> None:
-        if not isinstance(summary, Summary):
-            raise TypeError(
-                f"summary must be of type `Summary`, but got value {summary} of type {type(summary).__name__}"
-            )
-        self.__summary = summary
-
     def crt_a_element(self, element: CelestialBase) -> Self:
         """Adds a single celestial element to the experiment."""
         self.status_save.append_element(element)
@@ -233,23 +138,6 @@ class CelestialExperiment:
             "Interfaces": {"Play-Expanded": False, "Chart-Expanded": False},
         }
 
-    def save_to(self, path: pathlib.Path) -> None:
-        """Saves the experiment to a .plsav file at the given path.
-
-        Args:
-            path: The filesystem path of the target .plsav file.
-
-        Raises:
-            TypeError: If path is not a pathlib.Path instance.
-        """
-        if not isinstance(path, pathlib.Path):
-            raise TypeError(
-                f"path must be of type `Path`, but got value {path} of type {type(path).__name__}"
-            )
-
-        with open(path, "w", encoding="utf-8", newline="\n") as f:
-            json.dump(self.as_plsav_dict(), f, ensure_ascii=True)
-
     def merge(self, other: "CelestialExperiment") -> Self:
         """Merges another CelestialExperiment's elements into this one.
 
@@ -272,8 +160,42 @@ class CelestialExperiment:
         return self
 
 
+_MODEL_TO_PLANET: Dict[str, Type[CelestialBase]] = {
+    "Mercury": planets.Mercury,
+    "Venus": planets.Venus,
+    "Earth": planets.Earth,
+    "Mars": planets.Mars,
+    "Jupiter": planets.Jupiter,
+    "Saturn": planets.Saturn,
+    "Uranus": planets.Uranus,
+    "Neptune": planets.Neptune,
+    "Pluto": planets.Pluto,
+    "Sun": planets.Sun,
+    "Blue Giant": planets.BlueGiant,
+    "Red Giant": planets.RedGiant,
+    "Red Dwarf": planets.RedDwarf,
+    "White Dwarf": planets.WhiteDwarf,
+    "Blackhole": planets.Blackhole,
+    "Fantasy Star": planets.FantasyStar,
+    "Moon": planets.Moon,
+    "Chocolate Ball": planets.ChocolateBall,
+    "Continential": planets.Continential,
+    "Arctic": planets.Arctic,
+    "Arid": planets.Arid,
+    "Barren": planets.Barren,
+    "Desert": planets.Desert,
+    "Jungle": planets.Jungle,
+    "Toxic": planets.Toxic,
+    "Lava": planets.Lava,
+    "Ocean": planets.Ocean,
+}
+
+
 def _dict_to_element(element_dict: dict) -> CelestialBase:
-    model_id = element_dict["Model"]
+    planet_type = _MODEL_TO_PLANET.get(element_dict["Model"])
+    if planet_type is None:
+        errors.unreachable()
+
     identifier = element_dict["Identifier"]
     position = coordinate_system.construct_position_from_plsav_str(
         element_dict["Position"]
@@ -285,62 +207,7 @@ def _dict_to_element(element_dict: dict) -> CelestialBase:
         element_dict["Acceleration"]
     )
 
-    if model_id == "Mercury":
-        return planets.Mercury(position, velocity, acceleration, identifier)
-    elif model_id == "Venus":
-        return planets.Venus(position, velocity, acceleration, identifier)
-    elif model_id == "Earth":
-        return planets.Earth(position, velocity, acceleration, identifier)
-    elif model_id == "Mars":
-        return planets.Mars(position, velocity, acceleration, identifier)
-    elif model_id == "Jupiter":
-        return planets.Jupiter(position, velocity, acceleration, identifier)
-    elif model_id == "Saturn":
-        return planets.Saturn(position, velocity, acceleration, identifier)
-    elif model_id == "Uranus":
-        return planets.Uranus(position, velocity, acceleration, identifier)
-    elif model_id == "Neptune":
-        return planets.Neptune(position, velocity, acceleration, identifier)
-    elif model_id == "Pluto":
-        return planets.Pluto(position, velocity, acceleration, identifier)
-    elif model_id == "Sun":
-        return planets.Sun(position, velocity, acceleration, identifier)
-    elif model_id == "Blue Giant":
-        return planets.BlueGiant(position, velocity, acceleration, identifier)
-    elif model_id == "Red Giant":
-        return planets.RedGiant(position, velocity, acceleration, identifier)
-    elif model_id == "Red Dwarf":
-        return planets.RedDwarf(position, velocity, acceleration, identifier)
-    elif model_id == "White Dwarf":
-        return planets.WhiteDwarf(position, velocity, acceleration, identifier)
-    elif model_id == "Blackhole":
-        return planets.Blackhole(position, velocity, acceleration, identifier)
-    elif model_id == "Fantasy Star":
-        return planets.FantasyStar(position, velocity, acceleration, identifier)
-    elif model_id == "Moon":
-        return planets.Moon(position, velocity, acceleration, identifier)
-    elif model_id == "Chocolate Ball":
-        return planets.ChocolateBall(position, velocity, acceleration, identifier)
-    elif model_id == "Continential":
-        return planets.Continential(position, velocity, acceleration, identifier)
-    elif model_id == "Arctic":
-        return planets.Arctic(position, velocity, acceleration, identifier)
-    elif model_id == "Arid":
-        return planets.Arid(position, velocity, acceleration, identifier)
-    elif model_id == "Barren":
-        return planets.Barren(position, velocity, acceleration, identifier)
-    elif model_id == "Desert":
-        return planets.Desert(position, velocity, acceleration, identifier)
-    elif model_id == "Jungle":
-        return planets.Jungle(position, velocity, acceleration, identifier)
-    elif model_id == "Toxic":
-        return planets.Toxic(position, velocity, acceleration, identifier)
-    elif model_id == "Lava":
-        return planets.Lava(position, velocity, acceleration, identifier)
-    elif model_id == "Ocean":
-        return planets.Ocean(position, velocity, acceleration, identifier)
-    else:
-        errors.unreachable()
+    return planet_type(position, velocity, acceleration, identifier)
 
 
 def crt_celestial_experiment(name: Optional[str]) -> CelestialExperiment:
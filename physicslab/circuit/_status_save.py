@@ -1,17 +1,19 @@
 """Runtime state storage for a circuit experiment."""
 
-import json
 from physicslab import errors
 from .base import CircuitBase, Pin
 from .wire import WireInfo
 from physicslab import coordinate_system
 from physicslab._typing import List, Dict
+from physicslab._experiment import serialize_json_in_plsav
 from physicslab.vendor import undirected_graph
 
 
 class CircuitStatusSave:
     """Stores the runtime state of a circuit experiment (elements, wires, look-ups)."""
 
+    __slots__ = ("__elements", "__id2element", "__position2element", "__circuit_graph")
+
     __elements: List[CircuitBase]
     __id2element: Dict[str, CircuitBase]
     __position2element: Dict[coordinate_system.Position, CircuitBase]
@@ -198,4 +200,4 @@ class CircuitStatusSave:
 
     def as_str_in_plsav(self) -> str:
         """Serialise the experiment status to a JSON string for a ``.plsav`` file."""
-        return json.dumps(self.as_dict())
+        return serialize_json_in_plsav(self.as_dict())
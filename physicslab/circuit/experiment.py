@@ -12,8 +12,12 @@ from physicslab.utils import (
 from physicslab.enums import Category, ColorOfWire, SwitchState, PDTSwitchState
 from physicslab.web import User, anonymous_login
 from physicslab._camera_save import CameraMode, CameraSave
-from physicslab._typing import Optional, Self, Tuple, Set
-from physicslab._summary import Summary, construct_summary_from_plsav_dict
+from physicslab._experiment_base import ExperimentBase
+from physicslab._typing import Optional, Self, Tuple, Set, Dict
+from physicslab._summary import (
+    construct_default_summary,
+    construct_summary_from_plsav_dict,
+)
 from physicslab._experiment import (
     TYPE_TAG_CIRCUIT,
 )
@@ -23,12 +27,12 @@ from ._status_save import CircuitStatusSave
 from .wire import WireInfo
 
 
-class CircuitExperiment:
+class CircuitExperiment(ExperimentBase):
     """Represents a complete circuit experiment with elements, wires and camera state."""
 
+    __slots__ = ("__status_save",)
+
     __status_save: CircuitStatusSave
-    __camera_save: CameraSave
-    __summary: Summary
 
     def __init__(
         self,
@@ -44,68 +48,14 @@ class CircuitExperiment:
     ) -> None:
         self.status_save = CircuitStatusSave()
         self.camera_save = camera_save
-        self.summary = Summary(
+        self.summary = construct_default_summary(
             experiment_type=0,
+            type_tag=TYPE_TAG_CIRCUIT,
             subject=name,
             description=introduction,
-            tags=set() if tags is None else tags,
-            type_tag=TYPE_TAG_CIRCUIT,
-            parent_id=None,
-            parent_name=None,
-            parent_category=None,
-            content_id=None,
-            editor=None,
-            coauthors=[],
-            localized_description=None,
-            model_id=None,
-            model_name=None,
-            model_tags=[],
-            version=0,
-            language=None,
-            visits=0,
-            stars=0,
-            supports=0,
-            remixes=0,
-            comments=0,
-            price=0,
-            popularity=0,
-            creation_date=int(time.time() * 1000),
-            update_date=0,
-            sorting_date=0,
-            summary_id=None,
-            category=None,
-            localized_subject=None,
-            image=0,
-            image_region=0,
-            user={
-                "ID": None,
-                "Nickname": None,
-                "Signature": None,
-                "Avatar": 0,
-                "AvatarRegion": 0,
-                "Decoration": 0,
-                "Verification": None,
-            },
-            visibility=0,
-            settings={},
-            multilingual=False,
+            tags=tags,
         )
 
-    def __enter__(self) -> Self:
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback) -> None:
-        pass
-
-    @property
-    def name(self) -> Optional[str]:
-        """Display name of this experiment (may be ``None``)."""
-        return self.summary.subject
-
-    @name.setter
-    def name(self, name: Optional[str]) -> None:
-        self.summary.subject = name
-
     @property
     def status_save(self) -> CircuitStatusSave:
         """Runtime state (elements and wires) of this experiment."""
@@ -120,51 +70,6 @@ class CircuitExperiment:
 
         self.__status_save = status_save
 
-    @property
-    def camera_save(self) -> CameraSave:
-        """Camera state saved with this experiment."""
-        return self.__camera_save
-
-    @camera_save.setter
-    def camera_save(self, camera_save: CameraSave) -> None:
-        if not isinstance(camera_save, CameraSave):
-            raise TypeError(
-                f"camera_save must be of type `CameraSave`, but got value {camera_save} of type {type(camera_save).__name__}"
-            )
-
-        self.__camera_save = camera_save
-
-    @property
-    def introduction(self) -> Optional[str]:
-        """Introduction of this experiment (may be ``None``)."""
-        return self.summary.description
-
-    @introduction.setter
-    def introduction(self, introduction: Optional[str]) -> None:
-        self.summary.description = introduction
-
-    @property
-    def tags(self) -> Set[enums.Tag]:
-        """Community tags of this experiment."""
-        return self.summary.tags
-
-    @tags.setter
-    def tags(self, tags: Set[enums.Tag]) -> None:
-        self.summary.tags = tags
-
-    @property
-    def summary(self) -> Summary:
-        """Summary metadata of this experiment."""
-        return self.__summary
-
-    @summary.setter
-    def summary(self, summary: Summary) -> None:
-        if not isinstance(summary, Summary):
-            raise TypeError(
-                f"summary must be of type `Summary`, but got value {summary} of type {type(summary).__name__}"
-            )
-        self.__summary = summary
-
     def crt_a_element(self, element: CircuitBase) -> Self:
         """Add a single element to this experiment and return ``self``."""
         self.status_save.append_element(element)
@@ -290,15 +195,6 @@ class CircuitExperiment:
             "Interfaces": {"Play-Expanded": False, "Chart-Expanded": False},
         }
 
-    def save_to(self, path: pathlib.Path) -> None:
-        """Write this experiment to *path* as a ``.plsav`` JSON file."""
-        if not isinstance(path, pathlib.Path):
-            raise TypeError(
-                f"path must be of type `Path`, but got value {path} of type {type(path).__name__}"
-            )
-        with path.open("w", encoding="utf-8", newline="\n") as f:
-            json.dump(self.as_plsav_dict(), f, ensure_ascii=True)
-
     def merge(self, other: "CircuitExperiment") -> Self:
         """Merge all elements and wires from *other* into this experiment."""
         if not isinstance(other, CircuitExperiment):
@@ -333,17 +229,23 @@ def _construct_pin_by_label(element: CircuitBase, pin_label: int) -> Pin:
     )
 
 
+_COLOR_OF_WIRE_BY_PREFIX: Dict[str, ColorOfWire] = {
+    color.value: color for color in ColorOfWire
+}
+
+
 def _construct_color_of_wire(color_name: str) -> ColorOfWire:
     if not isinstance(color_name, str):
         raise TypeError(
             f"color_name must be of type `str`, but got value {color_name} of type {type(color_name).__name__}"
         )
 
-    for color in ColorOfWire:
-        if color_name.startswith(color.value):
-            return color
+    # ColorName is stored as e.g. "蓝色导线"; every color value is one character
+    color = _COLOR_OF_WIRE_BY_PREFIX.get(color_name[:1])
+    if color is None:
+        raise ValueError(f"unknown wire color: {color_name}")
 
-    raise ValueError(f"unknown wire color: {color_name}")
+    return color
 
 
 def _dict_to_element(element_dict: dict) -> CircuitBase:
@@ -1113,98 +1015,14 @@ def load_circuit_experiment_by_file_path(path: pathlib.Path) -> CircuitExperimen
             plasv_dict["Summary"], experiment_type=0, type_tag=TYPE_TAG_CIRCUIT
         )
     elif "Experiment" in plasv_dict and "Subject" in plasv_dict["Experiment"]:
-        summary = Summary(
+        summary = construct_default_summary(
             experiment_type=0,
-            subject=plasv_dict["Experiment"]["Subject"],
-            description=None,
-            tags=set(),
             type_tag=TYPE_TAG_CIRCUIT,
-            parent_id=None,
-            parent_name=None,
-            parent_category=None,
-            content_id=None,
-            editor=None,
-            coauthors=[],
-            localized_description=None,
-            model_id=None,
-            model_name=None,
-            model_tags=[],
-            version=0,
-            language=None,
-            visits=0,
-            stars=0,
-            supports=0,
-            remixes=0,
-            comments=0,
-            price=0,
-            popularity=0,
-            creation_date=int(time.time() * 1000),
-            update_date=0,
-            sorting_date=0,
-            summary_id=None,
-            category=None,
-            localized_subject=None,
-            image=0,
-            image_region=0,
-            user={
-                "ID": None,
-                "Nickname": None,
-                "Signature": None,
-                "Avatar": 0,
-                "AvatarRegion": 0,
-                "Decoration": 0,
-                "Verification": None,
-            },
-            visibility=0,
-            settings={},
-            multilingual=False,
+            subject=plasv_dict["Experiment"]["Subject"],
         )
     else:
-        summary = Summary(
-            experiment_type=0,
-            subject=plasv_dict["Subject"],
-            description=None,
-            tags=set(),
-            type_tag=TYPE_TAG_CIRCUIT,
-            parent_id=None,
-            parent_name=None,
-            parent_category=None,
-            content_id=None,
-            editor=None,
-            coauthors=[],
-            localized_description=None,
-            model_id=None,
-            model_name=None,
-            model_tags=[],
-            version=0,
-            language=None,
-            visits=0,
-            stars=0,
-            supports=0,
-            remixes=0,
-            comments=0,
-            price=0,
-            popularity=0,
-            creation_date=int(time.time() * 1000),
-            update_date=0,
-            sorting_date=0,
-            summary_id=None,
-            category=None,
-            localized_subject=None,
-            image=0,
-            image_region=0,
-            user={
-                "ID": None,
-                "Nickname": None,
-                "Signature": None,
-                "Avatar": 0,
-                "AvatarRegion": 0,
-                "Decoration": 0,
-                "Verification": None,
-            },
-            visibility=0,
-            settings={},
-            multilingual=False,
+        summary = construct_default_summary(
+            experiment_type=0, type_tag=TYPE_TAG_CIRCUIT, subject=plasv_dict["Subject"]
         )
 
     if "Experiment" in plasv_dict.keys():
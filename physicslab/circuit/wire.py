@@ -6,6 +6,8 @@ from physicslab.enums import ColorOfWire
 class WireInfo:
     """Metadata associated with a single wire between two circuit pins."""
 
+    __slots__ = ("__color",)
+
     __color: ColorOfWire
 
     def __init__(self, color: ColorOfWire = ColorOfWire.blue) -> None:
@@ -11,23 +11,27 @@ from ._typing import num_type
 class Position:
     """An immutable 3-D position vector (x, y, z)."""
 
+    __slots__ = ("x", "y", "z")
+
     x: num_type
     y: num_type
     z: num_type
 
     def __init__(self, x: num_type, y: num_type, z: num_type) -> None:
-        if not isinstance(x, (int, float)):
-            raise TypeError(
-                f"Parameter `x` must be of type `int | float`, but got value `{x}` of type `{type(x).__name__}`"
-            )
-        if not isinstance(y, (int, float)):
-            raise TypeError(
-                f"Parameter `y` must be of type `int | float`, but got value `{y}` of type `{type(y).__name__}`"
-            )
-        if not isinstance(z, (int, float)):
-            raise TypeError(
-                f"Parameter `z` must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
-            )
+        # fast path: values parsed from plsav strings are always exact floats
+        if not (type(x) is float and type(y) is float and type(z) is float):
+            if not isinstance(x, (int, float)):
+                raise TypeError(
+                    f"Parameter `x` must be of type `int | float`, but got value `{x}` of type `{type(x).__name__}`"
+                )
+            if not isinstance(y, (int, float)):
+                raise TypeError(
+                    f"Parameter `y` must be of type `int | float`, but got value `{y}` of type `{type(y).__name__}`"
+                )
+            if not isinstance(z, (int, float)):
+                raise TypeError(
+                    f"Parameter `z` must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
+                )
 
         self.x: num_type = x
         self.y: num_type = y
@@ -80,23 +84,27 @@ def construct_position_from_plsav_str(position_str: str) -> Position:
 class Rotation:
     """An immutable 3-D rotation vector (x, y, z) in Euler angles."""
 
+    __slots__ = ("x", "y", "z")
+
     x: num_type
     y: num_type
     z: num_type
 
     def __init__(self, x: num_type, y: num_type, z: num_type) -> None:
-        if not isinstance(x, (int, float)):
-            raise TypeError(
-                f"Parameter `x` must be of type `int | float`, but got value `{x}` of type `{type(x).__name__}`"
-            )
-        if not isinstance(y, (int, float)):
-            raise TypeError(
-                f"Parameter `y` must be of type `int | float`, but got value `{y}` of type `{type(y).__name__}`"
-            )
-        if not isinstance(z, (int, float)):
-            raise TypeError(
-                f"Parameter `z` must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
-            )
+        # fast path: values parsed from plsav strings are always exact floats
+        if not (type(x) is float and type(y) is float and type(z) is float):
+            if not isinstance(x, (int, float)):
+                raise TypeError(
+                    f"Parameter `x` must be of type `int | float`, but got value `{x}` of type `{type(x).__name__}`"
+                )
+            if not isinstance(y, (int, float)):
+                raise TypeError(
+                    f"Parameter `y` must be of type `int | float`, but got value `{y}` of type `{type(y).__name__}`"
+                )
+            if not isinstance(z, (int, float)):
+                raise TypeError(
+                    f"Parameter `z` must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
+                )
 
         self.x: num_type = x
         self.y: num_type = y
@@ -149,23 +157,27 @@ def construct_rotation_from_plsav_str(rotation_str: str) -> Rotation:
 class Velocity:
     """An immutable 3-D velocity vector (x, y, z)."""
 
+    __slots__ = ("x", "y", "z")
+
     x: num_type
     y: num_type
     z: num_type
 
     def __init__(self, x: num_type, y: num_type, z: num_type) -> None:
-        if not isinstance(x, (int, float)):
-            raise TypeError(
-                f"Parameter `x` must be of type `int | float`, but got value `{x}` of type `{type(x).__name__}`"
-            )
-        if not isinstance(y, (int, float)):
-            raise TypeError(
-                f"Parameter `y` must be of type `int | float`, but got value `{y}` of type `{type(y).__name__}`"
-            )
-        if not isinstance(z, (int, float)):
-            raise TypeError(
-                f"Parameter `z` must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
-            )
+        # fast path: values parsed from plsav strings are always exact floats
+        if not (type(x) is float and type(y) is float and type(z) is float):
+            if not isinstance(x, (int, float)):
+                raise TypeError(
+                    f"Parameter `x` must be of type `int | float`, but got value `{x}` of type `{type(x).__name__}`"
+                )
+            if not isinstance(y, (int, float)):
+                raise TypeError(
+                    f"Parameter `y` must be of type `int | float`, but got value `{y}` of type `{type(y).__name__}`"
+                )
+            if not isinstance(z, (int, float)):
+                raise TypeError(
+                    f"Parameter `z` must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
+                )
 
         self.x: num_type = x
         self.y: num_type = y
@@ -218,23 +230,27 @@ def construct_velocity_from_plsav_str(velocity_str: str) -> Velocity:
 class AngularVelocity:
     """An immutable 3-D angular velocity vector (x, y, z)."""
 
+    __slots__ = ("x", "y", "z")
+
     x: num_type
     y: num_type
     z: num_type
 
     def __init__(self, x: num_type, y: num_type, z: num_type) -> None:
-        if not isinstance(x, (int, float)):
-            raise TypeError(
-                f"Parameter `x` must be of type `int | float`, but got value `{x}` of type `{type(x).__name__}`"
-            )
-        if not isinstance(y, (int, float)):
-            raise TypeError(
-                f"Parameter `y` must be of type `int | float`, but got value `{y}` of type `{type(y).__name__}`"
-            )
-        if not isinstance(z, (int, float)):
-            raise TypeError(
-                f"Parameter `z` must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
-            )
+        # fast path: values parsed from plsav strings are always exact floats
+        if not (type(x) is float and type(y) is float and type(z) is float):
+            if not isinstance(x, (int, float)):
+                raise TypeError(
+                    f"Parameter `x` must be of type `int | float`, but got value `{x}` of type `{type(x).__name__}`"
+                )
+            if not isinstance(y, (int, float)):
+                raise TypeError(
+                    f"Parameter `y` must be of type `int | float`, but got value `{y}` of type `{type(y).__name__}`"
+                )
+            if not isinstance(z, (int, float)):
+                raise TypeError(
+                    f"Parameter `z` must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
+                )
 
         self.x: num_type = x
         self.y: num_type = y
@@ -289,23 +305,27 @@ def construct_angular_velocity_from_plsav_str(
 class Acceleration:
     """An immutable 3-D acceleration vector (x, y, z)."""
 
+    __slots__ = ("x", "y", "z")
+
     x: num_type
     y: num_type
     z: num_type
 
     def __init__(self, x: num_type, y: num_type, z: num_type) -> None:
-        if not isinstance(x, (int, float)):
-            raise TypeError(
-                f"Parameter `x` must be of type `int | float`, but got value `{x}` of type `{type(x).__name__}`"
-            )
-        if not isinstance(y, (int, float)):
-            raise TypeError(
-                f"Parameter `y` must be of type `int | float`, but got value `{y}` of type `{type(y).__name__}`"
-            )
-        if not isinstance(z, (int, float)):
-            raise TypeError(
-                f"Parameter `z` must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
-            )
+        # fast path: values parsed from plsav strings are always exact floats
+        if not (type(x) is float and type(y) is float and type(z) is float):
+            if not isinstance(x, (int, float)):
+                raise TypeError(
+                    f"Parameter `x` must be of type `int | float`, but got value `{x}` of type `{type(x).__name__}`"
+                )
+            if not isinstance(y, (int, float)):
+                raise TypeError(
+                    f"Parameter `y` must be of type `int | float`, but got value `{y}` of type `{type(y).__name__}`"
+                )
+            if not isinstance(z, (int, float)):
+                raise TypeError(
+                    f"Parameter `z` must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
+                )
 
         self.x: num_type = x
         self.y: num_type = y
@@ -1,15 +1,17 @@
 """Runtime state storage for an electromagnetism experiment."""
 
-import json
 from physicslab import coordinate_system
 from physicslab import errors
 from physicslab._typing import List, Dict
+from physicslab._experiment import serialize_json_in_plsav
 from . import _base
 
 
 class ElectromagnetismStatusSave:
     """Stores the runtime state of an electromagnetism experiment (elements, look-ups)."""
 
+    __slots__ = ("__elements", "__id2element", "__position2element")
+
     __elements: List[_base.ElectromagnetismBase]
     __id2element: Dict[str, _base.ElectromagnetismBase]
     __position2element: Dict[coordinate_system.Position, _base.ElectromagnetismBase]
@@ -127,4 +129,4 @@ class ElectromagnetismStatusSave:
 
     def as_str_in_plsav(self) -> str:
         """Serialise the experiment status to a JSON string for a ``.plsav`` file."""
-        return json.dumps(self.as_dict())
+        return serialize_json_in_plsav(self.as_dict())
@@ -9,23 +9,27 @@ from physicslab.utils import find_path_of_sav_name
 from physicslab import coordinate_system
 from physicslab.enums import Category
 from physicslab.web import User, anonymous_login
-from physicslab._summary import Summary, construct_summary_from_plsav_dict
+from physicslab._summary import (
+    construct_default_summary,
+    construct_summary_from_plsav_dict,
+)
 from physicslab._experiment import (
     TYPE_TAG_ELECTROMAGNETISM,
 )
 from . import elements
 from physicslab._camera_save import CameraMode, CameraSave
+from physicslab._experiment_base import ExperimentBase
 from ._status_save import ElectromagnetismStatusSave
 from ._base import ElectromagnetismBase
-from physicslab._typing import Self, Optional, Tuple, Set
+from physicslab._typing import Self, Optional, Tuple, Set, Dict, Type
 
 
-class ElectromagnetismExperiment:
+class ElectromagnetismExperiment(ExperimentBase):
     """Represents a complete electromagnetism experiment with elements and camera state."""
 
+    __slots__ = ("__status_save",)
+
     __status_save: ElectromagnetismStatusSave
-    __camera_save: CameraSave
-    __summary: Summary
 
     def __init__(
         self,
@@ -41,68 +45,14 @@ class ElectromagnetismExperiment:
     ) -> None:
         self.status_save = ElectromagnetismStatusSave()
         self.camera_save = camera_save
-        self.summary = Summary(
+        self.summary = construct_default_summary(
             experiment_type=4,
+            type_tag=TYPE_TAG_ELECTROMAGNETISM,
             subject=name,
             description=introduction,
-            tags=set() if tags is None else tags,
-            type_tag=TYPE_TAG_ELECTROMAGNETISM,
-            parent_id=None,
-            parent_name=None,
-            parent_category=None,
-            content_id=None,
-            editor=None,
-            coauthors=[],
-            localized_description=None,
-            model_id=None,
-            model_name=None,
-            model_tags=[],
-            version=0,
-            language=None,
-            visits=0,
-            stars=0,
-            supports=0,
-            remixes=0,
-            comments=0,
-            price=0,
-            popularity=0,
-            creation_date=int(time.time() * 1000),
-            update_date=0,
-            sorting_date=0,
-            summary_id=None,
-            category=None,
-            localized_subject=None,
-            image=0,
-            image_region=0,
-            user={
-                "ID": None,
-                "Nickname": None,
-                "Signature": None,
-                "Avatar": 0,
-                "AvatarRegion": 0,
-                "Decoration": 0,
-                "Verification": None,
-            },
-            visibility=0,
-            settings={},
-            multilingual=False,
+            tags=tags,
         )
 
-    def __enter__(self) -> Self:
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback) -> None:
-        pass
-
-    @property
-    def name(self) -> Optional[str]:
-        """Display name of this experiment (may be ``None``)."""
-        return self.summary.subject
-
-    @name.setter
-    def name(self, name: Optional[str]) -> None:
-        self.summary.subject = name
-
     @property
     def status_save(self) -> ElectromagnetismStatusSave:
         """Runtime state (elements) of this experiment."""
@@ -117,51 +67,6 @@ class ElectromagnetismExperiment:
 
         self.__status_save = status_save
 
-    @property
-    def camera_save(self) -> CameraSave:
-        """Camera state saved with this experiment."""
-        return self.__camera_save
-
-    @camera_save.setter
-    def camera_save(self, camera_save: CameraSave) -> None:
-        if not isinstance(camera_save, CameraSave):
-            raise TypeError(
-                f"camera_save must be of type `CameraSave`, but got value {camera_save} of type {type(camera_save).__name__}"
-            )
-
-        self.__camera_save = camera_save
-
-    @property
-    def introduction(self) -> Optional[str]:
-        """Introduction of this experiment (may be ``None``)."""
-        return self.summary.description
-
-    @introduction.setter
-    def introduction(self, introduction: Optional[str]) -> None:
-        self.summary.description = introduction
-
-    @property
-    def tags(self) -> Set[enums.Tag]:
-        """Community tags of this experiment."""
-        return self.summary.tags
-
-    @tags.setter
-    def tags(self, tags: Set[enums.Tag]) -> None:
-        self.summary.tags = tags
-
-    @property
-    def summary(self) -> Summary:
-        """Summary metadata of this experiment."""
-        return self.__summary
-
-    @summary.setter
-    def summary(self, summary: Summary) -> None:
-        if not isinstance(summary, Summary):
-            raise TypeError(
-                f"summary must be of type `Summary`, but got value {summary} of type {type(summary).__name__}"
-            )
-        self.__summary = summary
-
     def crt_a_element(self, element: ElectromagnetismBase) -> Self:
         """Add a single element to this experiment and return ``self``."""
         self.status_save.append_element(element)
@@ -236,16 +141,6 @@ class ElectromagnetismExperiment:
             "Interfaces": {"Play-Expanded": False, "Chart-Expanded": False},
         }
 
-    def save_to(self, path: pathlib.Path) -> None:
-        """Write this experiment to *path* as a ``.plsav`` JSON file."""
-        if not isinstance(path, pathlib.Path):
-            raise TypeError(
-                f"path must be of type `Path`, but got value {path} of type {type(path).__name__}"
-            )
-
-        with open(path, "w", encoding="utf-8", newline="\n") as f:
-            json.dump(self.as_plsav_dict(), f, ensure_ascii=True)
-
     def merge(self, other: "ElectromagnetismExperiment") -> Self:
         """Merge all elements from *other* into this experiment and return ``self``."""
         if not isinstance(other, ElectromagnetismExperiment):
@@ -258,82 +153,32 @@ class ElectromagnetismExperiment:
         return self
 
 
+_MODEL_ID_TO_ELEMENT: Dict[str, Type[ElectromagnetismBase]] = {
+    "Negative Charge": elements.NegativeCharge,
+    "Positive Charge": elements.PositiveCharge,
+    "Negative Test Charge": elements.NegativeTestCharge,
+    "Positive Test Charge": elements.PositiveTestCharge,
+    "Bar Magnet": elements.BarMagnet,
+    "Compass": elements.Compass,
+    "Uniform Magnetic Field": elements.UniformMagneticField,
+}
+
+
 def _dict_to_element(element_dict: dict) -> ElectromagnetismBase:
-    model_id = element_dict["ModelID"]
-
-    if model_id == "Negative Charge":
-        return elements.NegativeCharge(
-            position=coordinate_system.construct_position_from_plsav_str(
-                element_dict["Position"]
-            ),
-            rotation=coordinate_system.construct_rotation_from_plsav_str(
-                element_dict["Rotation"]
-            ),
-            identifier=element_dict["Identifier"],
-        )
-    elif model_id == "Positive Charge":
-        return elements.PositiveCharge(
-            position=coordinate_system.construct_position_from_plsav_str(
-                element_dict["Position"]
-            ),
-            rotation=coordinate_system.construct_rotation_from_plsav_str(
-                element_dict["Rotation"]
-            ),
-            identifier=element_dict["Identifier"],
-        )
-    elif model_id == "Negative Test Charge":
-        return elements.NegativeTestCharge(
-            position=coordinate_system.construct_position_from_plsav_str(
-                element_dict["Position"]
-            ),
-            rotation=coordinate_system.construct_rotation_from_plsav_str(
-                element_dict["Rotation"]
-            ),
-            identifier=element_dict["Identifier"],
-        )
-    elif model_id == "Positive Test Charge":
-        return elements.PositiveTestCharge(
-            position=coordinate_system.construct_position_from_plsav_str(
-                element_dict["Position"]
-            ),
-            rotation=coordinate_system.construct_rotation_from_plsav_str(
-                element_dict["Rotation"]
-            ),
-            identifier=element_dict["Identifier"],
-        )
-    elif model_id == "Bar Magnet":
-        return elements.BarMagnet(
-            position=coordinate_system.construct_position_from_plsav_str(
-                element_dict["Position"]
-            ),
-            rotation=coordinate_system.construct_rotation_from_plsav_str(
-                element_dict["Rotation"]
-            ),
-            identifier=element_dict["Identifier"],
-        )
-    elif model_id == "Compass":
-        return elements.Compass(
-            position=coordinate_system.construct_position_from_plsav_str(
-                element_dict["Position"]
-            ),
-            rotation=coordinate_system.construct_rotation_from_plsav_str(
-                element_dict["Rotation"]
-            ),
-            identifier=element_dict["Identifier"],
-        )
-    elif model_id == "Uniform Magnetic Field":
-        return elements.UniformMagneticField(
-            position=coordinate_system.construct_position_from_plsav_str(
-                element_dict["Position"]
-            ),
-            rotation=coordinate_system.construct_rotation_from_plsav_str(
-                element_dict["Rotation"]
-            ),
-            identifier=element_dict["Identifier"],
-        )
-    else:
+    element_type = _MODEL_ID_TO_ELEMENT.get(element_dict["ModelID"])
+    if element_type is None:
         errors.unreachable()
 
+    return element_type(
+        position=coordinate_system.construct_position_from_plsav_str(
+            element_dict["Position"]
+        ),
+        rotation=coordinate_system.construct_rotation_from_plsav_str(
+            element_dict["Rotation"]
+        ),
+        identifier=element_dict["Identifier"],
+    )
+
 
 def crt_electromagnetism_experiment(name: Optional[str]) -> ElectromagnetismExperiment:
     """Create and return a new empty electromagnetism experiment with the given *name*."""
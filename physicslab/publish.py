@@ -5,7 +5,8 @@ import json
 import gzip
 import pathlib
 
-from physicslab import errors, quantum_physics
+from physicslab import errors
+from physicslab.quantum_physics import get_plar_version_number
 from physicslab.enums import Category
 from physicslab.circuit import CircuitExperiment
 from physicslab.celestial import CelestialExperiment
@@ -33,13 +34,6 @@ def _check_type(expe: _Experiment, user: User) -> None:
         )
 
 
-def _get_plar_version() -> int:
-    version = quantum_physics.get_quantum_physics_version()
-    if version is None:
-        return 2411
-    return int(f"{version[0]}{version[1]}{version[2]}")
-
-
 def _submit_experiment(
     expe: _Experiment,
     user: User,
@@ -55,7 +49,7 @@ def _submit_experiment(
         raise TypeError(
             f"Parameter `image_path` must be of type `Path` or `None`, but got value `{image_path}` of type `{type(image_path).__name__}`"
         )
-    if image_path is not None and (not image_path.exists() or not image_path.is_file()):
+    if image_path is not None and not image_path.is_file():
         raise FileNotFoundError(f"`{image_path}` not found")
     if not user.is_binded:
         raise PermissionError("you must register first")
@@ -74,7 +68,7 @@ def _submit_experiment(
     summary["User"]["AvatarRegion"] = user.avatar_region
     summary["User"]["Decoration"] = user.decoration
     summary["User"]["Verification"] = user.verification
-    summary["Version"] = _get_plar_version()
+    summary["Version"] = get_plar_version_number()
 
     if category is not None:
         summary["Category"] = category.value
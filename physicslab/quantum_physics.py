@@ -4,12 +4,18 @@ import platform
 
 import os
 import json
+import functools
 
 from typing import Optional, Tuple
 
 
+@functools.lru_cache(maxsize=None)
 def get_quantum_physics_version() -> Optional[Tuple[int, int, int]]:
-    """Get version of Quantum-Physics, return None if failed to get version"""
+    """Get version of Quantum-Physics, return None if failed to get version
+
+    The result is cached for the lifetime of the process, call
+    ``get_quantum_physics_version.cache_clear()`` to force a re-read.
+    """
     if platform.system() != "Windows":
         return None
 
@@ -43,6 +49,18 @@ def get_quantum_physics_version() -> Optional[Tuple[int, int, int]]:
         return None
 
 
+def get_plar_version_number() -> int:
+    """Get version of Quantum-Physics as the number Physics-Lab-AR expects, e.g. 2411 for 2.4.11
+
+    Falls back to 2411 if the version can not be read.
+    """
+    # get_quantum_physics_version is cached, so this is cheap to call per request
+    version = get_quantum_physics_version()
+    if version is None:
+        return 2411
+    return int(f"{version[0]}{version[1]}{version[2]}")
+
+
 def get_quantum_physics_path() -> Optional[str]:
     """Get path of Quantum-Physics"""
     if platform.system() != "Windows":
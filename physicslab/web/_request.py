@@ -1,11 +1,56 @@
 """Provide request related functionality."""
 
-import ssl
 import json
-import urllib.request
+import requests
+import http.cookiejar
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from physicslab._typing import Union, Dict
 
 
+class _Retry(Retry):
+    """urllib3 Retry that also re-sends non-idempotent requests answered with 429
+
+    POST is left out of `allowed_methods`, so a 5xx (which may come after the server
+    acted) is not replayed, but a 429 means the request was rejected unprocessed.
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# Every helper below goes through this session so keep-alive connections to the
+# Physics-Lab-AR hosts are reused instead of re-handshaking on each call
+_session = requests.Session()
+# the session is shared by every User in the process, so it must not carry one
+# login's cookies over to another; only the connections are meant to be reused
+_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+# transient statuses that are retried before the response reaches the caller,
+# POST (every API endpoint but Users) is only re-sent on 429, see _Retry
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# one pool per host (API, static images, image upload), each large enough for
+# every worker of the async executor in web.api
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=64,
+    # raise_on_status=False hands the last response back once retries run out,
+    # so callers see requests.HTTPError (which webutils._run_task retries) instead
+    # of requests.exceptions.RetryError
+    max_retries=_Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=_RETRY_STATUSES,
+        raise_on_status=False,
+    ),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
 def get_http(domain: str, path: str, port: int = 80) -> bytes:
     """Get http."""
     if not isinstance(domain, str):
@@ -21,10 +66,10 @@ def get_http(domain: str, path: str, port: int = 80) -> bytes:
             f"Parameter port must be of type `int`, but got value {port} of type `{type(port).__name__}`"
         )
 
-    url = f"http://{domain}:{port}/{path}"
-    req = urllib.request.urlopen(url)
+    response = _session.get(f"http://{domain}:{port}/{path}")
+    response.raise_for_status()
 
-    return req.read()
+    return response.content
 
 
 def get_https(domain: str, path: str, port: int = 443, verify: bool = True) -> bytes:
@@ -46,14 +91,32 @@ def get_https(domain: str, path: str, port: int = 443, verify: bool = True) -> b
             f"Parameter verify must be of type `bool`, but got value {verify} of type `{type(verify).__name__}`"
         )
 
-    url = f"https://{domain}:{port}/{path}"
-    if verify:
-        req = urllib.request.urlopen(url)
-    else:
-        context = ssl._create_unverified_context()
-        req = urllib.request.urlopen(url, context=context)
+    response = _session.get(f"https://{domain}:{port}/{path}", verify=verify)
+    response.raise_for_status()
+
+    return response.content
+
+
+def get_raw(url: str, verify: bool = True) -> requests.Response:
+    """Get `url` and return the response itself, for callers that inspect the body
 
-    return req.read()
+    Only the transient statuses still failing after the adapter's retries raise,
+    other error statuses are left to the caller.
+    """
+    if not isinstance(url, str):
+        raise TypeError(
+            f"Parameter url must be of type `str`, but got value {url} of type `{type(url).__name__}`"
+        )
+    if not isinstance(verify, bool):
+        raise TypeError(
+            f"Parameter verify must be of type `bool`, but got value {verify} of type `{type(verify).__name__}`"
+        )
+
+    response = _session.get(url, verify=verify)
+    if response.status_code in _RETRY_STATUSES:
+        response.raise_for_status()
+
+    return response
 
 
 def post_http(
@@ -90,18 +153,12 @@ def post_http(
     else:
         final_body = body
 
-    url = f"http://{domain}:{port}/{path}"
-    req = urllib.request.Request(url, data=final_body, method="POST")
-    req.headers = header
-
-    with urllib.request.urlopen(req) as response:
-        if response.info().get("Content-Encoding") == "gzip":
-            import gzip
+    response = _session.post(
+        f"http://{domain}:{port}/{path}", data=final_body, headers=header
+    )
+    response.raise_for_status()
 
-            content = gzip.decompress(response.read())
-        else:
-            content = response.read()
-        return json.loads(content)
+    return response.json()
 
 
 def post_https(
@@ -134,24 +191,34 @@ def post_https(
             f"Parameter port must be of type `int`, but got value {port} of type `{type(port).__name__}`"
         )
 
-    context = None
-    if verify == False:
-        context = ssl._create_unverified_context()
-
     if isinstance(body, dict):
         final_body = json.dumps(body).encode("utf-8")
     else:
         final_body = body
 
-    url = f"https://{domain}:{port}/{path}"
-    req = urllib.request.Request(url, data=final_body, method="POST")
-    req.headers = header
+    response = _session.post(
+        f"https://{domain}:{port}/{path}",
+        data=final_body,
+        headers=header,
+        verify=verify,
+    )
+    response.raise_for_status()
+
+    return response.json()
+
+
+def post_multipart(url: str, files: dict) -> dict:
+    """Post `files` to `url` as multipart/form-data."""
+    if not isinstance(url, str):
+        raise TypeError(
+            f"Parameter url must be of type `str`, but got value {url} of type `{type(url).__name__}`"
+        )
+    if not isinstance(files, dict):
+        raise TypeError(
+            f"Parameter files must be of type `dict`, but got value {files} of type `{type(files).__name__}`"
+        )
 
-    with urllib.request.urlopen(req, context=context) as response:
-        if response.info().get("Content-Encoding") == "gzip":
-            import gzip
+    response = _session.post(url, files=files)
+    response.raise_for_status()
 
-            content = gzip.decompress(response.read())
-        else:
-            content = response.read()
-        return json.loads(content)
+    return response.json()
@@ -3,13 +3,13 @@ Except for experiment upload API which is encapsulated in class Experiment's __u
 This file provides support for multi-threaded style API calls
 """
 
-import sys
+import re
 import json
 import asyncio
 import functools
 import contextvars
-import requests
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 from . import _request
 
@@ -17,7 +17,10 @@ from physicslab import quantum_physics
 from physicslab import enums
 from physicslab import errors
 from physicslab.enums import Tag, Category
-from physicslab._typing import Optional, List, Callable, Awaitable
+from physicslab._typing import Optional, List, Callable, Awaitable, Dict
+
+# Default Physics-Lab-AR API host, logins may target another one via `domain`
+_API_DOMAIN = "physics-api-cn.turtlesim.com"
 
 
 def _serialize_token(token: Optional[str]) -> str:
@@ -29,45 +32,20 @@ def _serialize_token(token: Optional[str]) -> str:
         errors.unreachable()
 
 
-async def _async_wrapper(func: Callable, *args, **kwargs):
-    if sys.version_info < (3, 9):
-        # copied from asyncio.to_thread
-        loop = asyncio.get_running_loop()
-        ctx = contextvars.copy_context()
-        func_call = functools.partial(ctx.run, func, *args, **kwargs)
-        return await loop.run_in_executor(None, func_call)
-    else:
-        return await asyncio.to_thread(func, *args, **kwargs)
-
-
-def _check_response(
-    response: requests.Response, err_callback: Optional[Callable] = None
-) -> dict:
-    """Check the returned response
-
-    Args:
-        response: requests response object
-        err_callback: Custom error message for Physics-Lab-AR returned status,
-                      requires status_code (captures status_code from Physics-Lab-AR response body), no return value
-
-    Returns:
-        dict: Physics-Lab-AR API response structure
-    """
-    assert err_callback is None or callable(err_callback)
-
-    response.raise_for_status()
+# Bounds how many blocking API calls the async_* wrappers keep in flight, so a
+# large asyncio.gather fan-out queues up instead of flooding the server
+_MAX_CONCURRENCY = 32
+_executor = ThreadPoolExecutor(
+    max_workers=_MAX_CONCURRENCY, thread_name_prefix="physicslab-web"
+)
 
-    response_json = response.json()
-    status_code = response_json["Status"]
 
-    if status_code == 200:
-        return response_json
-    if err_callback is not None:
-        err_callback(status_code)
-    raise errors.ResponseFail(
-        response_json()["code"],
-        f"Physics-Lab-AR's server returned error code {status_code}: {response_json['Message']}",
-    )
+async def _async_wrapper(func: Callable, *args, **kwargs):
+    # same as asyncio.to_thread, but on the bounded executor above
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    func_call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_executor, func_call)
 
 
 def _check_response_json(response: dict) -> dict:
@@ -87,9 +65,7 @@ def get_start_page() -> dict:
     Returns:
         dict: Physics-Lab-AR API response structure
     """
-    response = _request.get_https(
-        domain="physics-api-cn.turtlesim.com", port=443, path="Users"
-    )
+    response = _request.get_https(domain=_API_DOMAIN, port=443, path="Users")
 
     return _check_response_json(json.loads(response.decode("utf-8")))
 
@@ -99,6 +75,26 @@ async def async_get_start_page() -> Awaitable[dict]:
     return await _async_wrapper(get_start_page)
 
 
+_IMAGE_URL_TEMPLATES = {
+    ("users", True): (
+        "https://physics-static-cn.turtlesim.com:443"
+        "/users/avatars/{}/{}/{}/{}/{}.jpg!{}"
+    ),
+    ("users", False): (
+        "http://physics-static-cn.turtlesim.com:80"
+        "/users/avatars/{}/{}/{}/{}/{}.jpg!{}"
+    ),
+    ("experiments", True): (
+        "https://physics-static-cn.turtlesim.com:443"
+        "/experiments/images/{}/{}/{}/{}/{}.jpg!{}"
+    ),
+    ("experiments", False): (
+        "http://physics-static-cn.turtlesim.com:80"
+        "/experiments/images/{}/{}/{}/{}/{}.jpg!{}"
+    ),
+}
+
+
 def get_avatar(
     target_id: str,
     index: int,
@@ -147,29 +143,22 @@ def get_avatar(
             f"Parameter `size_category` must be one of ['small.round', 'thumbnail', 'full'], but got value `{size_category} of type '{size_category}'`"
         )
 
-    if category == "users":
-        category += "/avatars"
-    elif category == "experiments":
-        category += "/images"
-    else:
-        errors.unreachable()
-
-    protocol = "https" if usehttps else "http"
-    port = "443" if usehttps else "80"
-
-    url = (
-        f"{protocol}://physics-static-cn.turtlesim.com:{port}/{category}"
-        f"/{target_id[0:4]}/{target_id[4:6]}/{target_id[6:8]}/{target_id[8:]}/{index}.jpg!{size_category}"
+    url = _IMAGE_URL_TEMPLATES[(category, usehttps)].format(
+        target_id[0:4],
+        target_id[4:6],
+        target_id[6:8],
+        target_id[8:],
+        index,
+        size_category,
     )
 
-    if usehttps:
-        response = requests.get(url, verify=False)
-    else:
-        response = requests.get(url)
-
-    if b"<Error>" in response.content:
+    # certificate and domain of the static host mismatch, see `usehttps`
+    content = _request.get_raw(url, verify=not usehttps).content
+    # The static host answers a missing image with a short XML error document,
+    # so only its head needs scanning rather than the whole JPEG
+    if b"<Error>" in content[:512]:
         raise IndexError("avatar not found")
-    return response.content
+    return content
 
 
 async def async_get_avatar(
@@ -179,9 +168,47 @@ async def async_get_avatar(
     return await _async_wrapper(get_avatar, target_id, index, category, size_category)
 
 
+# Physics-Lab-AR supports multiple languages: Chinese, English, French, German, Spanish, Japanese, Ukrainian, Polish
+_REPLY_PREFIXES = (
+    "回复@",
+    "Reply@",
+    "Répondre@",
+    "Antworten@",
+    "Respuesta@",
+    "応答@",
+    "Відповісти@",
+    "Odpowiadać@",
+)
+_NICKNAME_END = re.compile("[: ]")
+
+# Users/GetUser body field for each lookup mode
+_GET_USER_FIELD = {
+    enums.GetUserMode.by_id: "ID",
+    enums.GetUserMode.by_name: "Name",
+}
+
+
 class User:
     """This class only provides blocking API"""
 
+    __slots__ = (
+        "token",
+        "auth_code",
+        "is_binded",
+        "device_token",
+        "user_id",
+        "nickname",
+        "signature",
+        "gold",
+        "level",
+        "avatar",
+        "avatar_region",
+        "decoration",
+        "verification",
+        "statistic",
+        "domain",
+    )
+
     token: Optional[str]
     auth_code: str
     # True: Account bound; False: Account not bound, anonymous login
@@ -299,29 +326,34 @@ class User:
         self.statistic: dict = statistic
         self.domain: str = domain
 
+    def _header(self) -> Dict[str, str]:
+        # Built per call so that reassigning `token` / `auth_code` takes effect
+        return {
+            "Content-Type": "application/json",
+            "x-API-Token": _serialize_token(self.token),
+            "x-API-AuthCode": self.auth_code,
+        }
+
+    def _post(self, path: str, body: dict) -> dict:
+        response = _request.post_https(
+            domain=self.domain, port=443, path=path, header=self._header(), body=body
+        )
+        return _check_response_json(response)
+
     def get_library(self) -> dict:
         """Get community works list
 
         Returns:
             dict: Physics-Lab-AR API response structure
         """
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Contents/GetLibrary",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Contents/GetLibrary",
+            {
                 "Identifier": "Discussions",
                 "Language": "Chinese",
             },
         )
 
-        return _check_response_json(response)
-
     async def async_get_library(self) -> Awaitable[dict]:
         """Execute the async get library routine."""
         return await _async_wrapper(self.get_library)
@@ -428,16 +460,9 @@ class User:
         else:
             _exclude_tags = [tag.value for tag in exclude_tags]
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Contents/QueryExperiments",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Contents/QueryExperiments",
+            {
                 "Query": {
                     "Category": category.value,
                     "Languages": languages,
@@ -459,8 +484,6 @@ class User:
             },
         )
 
-        return _check_response_json(response)
-
     async def async_query_experiments(
         self,
         category: enums.Category,
@@ -487,6 +510,66 @@ class User:
             from_skip,
         )
 
+    async def async_query_experiments_pages(
+        self,
+        category: enums.Category,
+        total: int,
+        page: int = 20,
+        tags: Optional[List[enums.Tag]] = None,
+        exclude_tags: Optional[List[enums.Tag]] = None,
+        languages: Optional[List[str]] = None,
+        exclude_languages: Optional[List[str]] = None,
+        user_id: Optional[str] = None,
+    ) -> Awaitable[List[dict]]:
+        """Query the first `total` experiments, requesting every page concurrently
+
+        Args:
+            category: Experiment area or black hole area
+            total: Number of experiments to query
+            page: Number of experiments per request
+            tags, exclude_tags, languages, exclude_languages, user_id: Same as `query_experiments`
+
+        Returns:
+            List[dict]: Experiments of all pages in order, i.e. the merged ["Data"]["$values"]
+        """
+        if not isinstance(total, int):
+            raise TypeError(
+                f"Parameter `total` must be of type `int`, but got value `{total}` of type `{type(total).__name__}`"
+            )
+        if not isinstance(page, int):
+            raise TypeError(
+                f"Parameter `page` must be of type `int`, but got value `{page}` of type `{type(page).__name__}`"
+            )
+        if total < 0:
+            raise ValueError(
+                f"Parameter `total` must be non-negative, but got value `{total}`"
+            )
+        if page <= 0:
+            raise ValueError(
+                f"Parameter `page` must be positive, but got value `{page}`"
+            )
+
+        responses = await asyncio.gather(
+            *(
+                self.async_query_experiments(
+                    category,
+                    tags,
+                    exclude_tags,
+                    languages,
+                    exclude_languages,
+                    user_id,
+                    take=min(page, total - skip),
+                    skip=skip,
+                )
+                for skip in range(0, total, page)
+            )
+        )
+        return [
+            experiment
+            for response in responses
+            for experiment in response["Data"]["$values"]
+        ]
+
     def get_experiment(
         self,
         content_id: str,
@@ -515,22 +598,13 @@ class User:
             # If experiment ID is passed, first get summary to obtain ContentID
             content_id = self.get_summary(content_id, category)["Data"]["ContentID"]
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Contents/GetExperiment",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Contents/GetExperiment",
+            {
                 "ContentID": content_id,
             },
         )
 
-        return _check_response_json(response)
-
     async def async_get_experiment(
         self,
         content_id: str,
@@ -569,16 +643,9 @@ class User:
                 f"Parameter `image_counter` must be of type `int`, but got value `{image_counter}` of type `{type(image_counter).__name__}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Contents/ConfirmExperiment",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Contents/ConfirmExperiment",
+            {
                 "SummaryID": summary_id,
                 "Category": category.value,
                 "Image": image_counter,
@@ -586,8 +653,6 @@ class User:
             },
         )
 
-        return _check_response_json(response)
-
     async def async_confirm_experiment(
         self, summary_id: str, category: enums.Category, image_counter: int
     ) -> Awaitable[dict]:
@@ -622,22 +687,13 @@ class User:
                 f"Parameter `reason` must be of type `str` or None, but got value `{reason}` of type `{type(reason).__name__}`"
             )
 
-        _plar_ver = quantum_physics.get_quantum_physics_version()
-        plar_ver = (
-            f"{_plar_ver[0]}{_plar_ver[1]}{_plar_ver[2]}"
-            if _plar_ver is not None
-            else "2411"
-        )
-
         response = _request.post_https(
             domain=self.domain,
             port=443,
             path="Contents/RemoveExperiment",
             header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-                "x-API-Version": plar_ver,
+                **self._header(),
+                "x-API-Version": str(quantum_physics.get_plar_version_number()),
             },
             body={
                 "Category": category.value,
@@ -708,27 +764,9 @@ class User:
         if reply_id is None:
             reply_id = ""
 
-            # Physics-Lab-AR supports multiple languages: Chinese, English, French, German, Spanish, Japanese, Ukrainian, Polish
-            if (
-                content.startswith("回复@")
-                or content.startswith("Reply@")
-                or content.startswith("Répondre@")
-                or content.startswith("Antworten@")
-                or content.startswith("Respuesta@")
-                or content.startswith("応答@")
-                or content.startswith("Відповісти@")
-                or content.startswith("Odpowiadać@")
-            ):
-                _nickname = ""
-                is_match: bool = False
-                for chr in content:
-                    if chr in (":", " "):
-                        break
-                    elif is_match:
-                        _nickname += chr
-                    elif chr == "@":
-                        is_match = True
-                        continue
+            if content.startswith(_REPLY_PREFIXES):
+                # the nickname runs from the first "@" up to the first ":" or " "
+                _nickname = _NICKNAME_END.split(content.partition("@")[2], 1)[0]
 
                 if _nickname != "":
                     try:
@@ -740,16 +778,9 @@ class User:
 
         assert isinstance(reply_id, str)
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Messages/PostComment",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Messages/PostComment",
+            {
                 "TargetID": target_id,
                 "TargetType": target_type,
                 "Language": "Chinese",
@@ -759,8 +790,6 @@ class User:
             },
         )
 
-        return _check_response_json(response)
-
     async def async_post_comment(
         self,
         target_id: str,
@@ -797,23 +826,14 @@ class User:
                 f"Parameter `target_type` must be one of ['User', 'Discussion', 'Experiment'], but got value `{target_type}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Messages/RemoveComment",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Messages/RemoveComment",
+            {
                 "TargetType": target_type,
                 "CommentID": comment_id,
             },
         )
 
-        return _check_response_json(response)
-
     async def async_remove_comment(
         self, comment_id: str, target_type: str
     ) -> Awaitable[dict]:
@@ -865,16 +885,9 @@ class User:
                 f"Parameter `target_type` must be one of ['User', 'Discussion', 'Experiment'], but got value `{target_type} of type '{target_type}'"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Messages/GetComments",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Messages/GetComments",
+            {
                 "TargetID": target_id,
                 "TargetType": target_type,
                 "CommentID": comment_id,
@@ -883,8 +896,6 @@ class User:
             },
         )
 
-        return _check_response_json(response)
-
     async def async_get_comments(
         self,
         target_id: str,
@@ -917,32 +928,14 @@ class User:
                 f"Parameter `category` must be an instance of Category enum, but got value `{category}` of type `{type(category).__name__}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Contents/GetSummary",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Contents/GetSummary",
+            {
                 "ContentID": content_id,
                 "Category": category.value,
             },
         )
 
-        def callback(status_code):
-            if status_code == 403:
-                raise PermissionError("login failed")
-            if status_code == 404:
-                raise errors.ResponseFail(
-                    response["code"],
-                    "experiment not found(may be you select category wrong)",
-                )
-
-        return _check_response_json(response)
-
     async def async_get_summary(
         self, content_id: str, category: enums.Category
     ) -> Awaitable[dict]:
@@ -968,29 +961,24 @@ class User:
                 f"Parameter `category` must be an instance of Category enum, but got value `{category}` of type `{type(category).__name__}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Contents/GetDerivatives",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Contents/GetDerivatives",
+            {
                 "ContentID": content_id,
                 "Category": category.value,
             },
         )
 
-        return _check_response_json(response)
-
     async def async_get_derivatives(
         self, content_id: str, category: enums.Category
     ) -> Awaitable[dict]:
         """Execute the async get derivatives routine."""
         return await _async_wrapper(self.get_derivatives, content_id, category)
 
+    def _get_user(self, field: str, value: str) -> dict:
+        # field is the Users/GetUser key, "ID" or "Name"
+        return self._post("Users/GetUser", {field: value})
+
     def get_user_by_name(self, name: str) -> dict:
         """Get user information
 
@@ -1004,19 +992,7 @@ class User:
             raise TypeError(
                 f"Parameter `name` must be of type `str`, but got value `{name}` of type `{type(name).__name__}`"
             )
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Users/GetUser",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={"Name": name},
-        )
-
-        return _check_response_json(response)
+        return self._get_user("Name", name)
 
     async def async_get_user_by_name(self, name: str) -> Awaitable[dict]:
         """Execute the async get user by name routine."""
@@ -1035,19 +1011,7 @@ class User:
             raise TypeError(
                 f"Parameter `id` must be of type `str`, but got value `{id}` of type `{type(id).__name__}`"
             )
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Users/GetUser",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={"ID": id},
-        )
-
-        return _check_response_json(response)
+        return self._get_user("ID", id)
 
     async def async_get_user_by_id(self, id: str) -> Awaitable[dict]:
         """Execute the async get user by id routine."""
@@ -1080,12 +1044,7 @@ class User:
                 f"`physicslab.enums.GetUserMode`, but got value `{get_user_mode}` of type {type(get_user_mode).__name__}`"
             )
 
-        if get_user_mode == enums.GetUserMode.by_id:
-            return self.get_user_by_id(msg)
-        elif get_user_mode == enums.GetUserMode.by_name:
-            return self.get_user_by_name(msg)
-        else:
-            errors.unreachable()
+        return self._get_user(_GET_USER_FIELD[get_user_mode], msg)
 
     async def async_get_user(
         self,
@@ -1101,22 +1060,13 @@ class User:
         Returns:
             dict: Physics-Lab-AR API response structure
         """
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Contents/GetProfile",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Contents/GetProfile",
+            {
                 "ID": self.user_id,
             },
         )
 
-        return _check_response_json(response)
-
     async def async_get_profile(self) -> Awaitable[dict]:
         """Execute the async get profile routine."""
         return await _async_wrapper(self.get_profile)
@@ -1156,16 +1106,9 @@ class User:
                 f"Parameter `star_type` must be one of [0, 1], but got value `{star_type} of type '{star_type}'`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Contents/StarContent",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Contents/StarContent",
+            {
                 "ContentID": content_id,
                 "Status": status,
                 "Category": category.value,
@@ -1173,8 +1116,6 @@ class User:
             },
         )
 
-        return _check_response_json(response)
-
     async def async_star_content(
         self,
         content_id: str,
@@ -1217,7 +1158,7 @@ class User:
             raise TypeError(
                 f"Parameter `image_path` must be of type `Path`, but got value `{image_path}` of type `{type(image_path).__name__}`"
             )
-        if not image_path.exists() or not image_path.is_file():
+        if not image_path.is_file():
             raise FileNotFoundError(f"`{image_path}` not found")
 
         with image_path.open("rb") as f:
@@ -1226,18 +1167,16 @@ class User:
                 "authorization": (None, authorization, None),
                 "file": ("temp.jpg", f, None),
             }
-            response = requests.post(
-                "http://v0.api.upyun.com/qphysics",
-                files=data,
+            response_json = _request.post_multipart(
+                "http://v0.api.upyun.com/qphysics", data
             )
-            response.raise_for_status()
-            if response.json()["code"] != 200:
+            if response_json["code"] != 200:
                 raise errors.ResponseFail(
-                    response.json()["code"],
-                    f"Physics-Lab-AR returned error code {response.json()['code']} : "
-                    f"{response.json()['message']}`",
+                    response_json["code"],
+                    f"Physics-Lab-AR returned error code {response_json['code']} : "
+                    f"{response_json['message']}`",
                 )
-            return response.json()
+            return response_json
 
     async def async_upload_image(
         self, policy: str, authorization: str, image_path: pathlib.Path
@@ -1261,22 +1200,13 @@ class User:
                 f"Parameter `message_id` must be of type `str`, but got value `{message_id}` of type `{type(message_id).__name__}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Messages/GetMessage",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Messages/GetMessage",
+            {
                 "MessageID": message_id,
             },
         )
 
-        return _check_response_json(response)
-
     async def async_get_message(self, message_id: str) -> Awaitable[dict]:
         """Execute the async get message routine."""
         return await _async_wrapper(self.get_message, message_id)
@@ -1317,16 +1247,9 @@ class User:
                 f"Parameter `no_templates` must be of type `bool`, but got value `{no_templates}` of type `{type(no_templates).__name__}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Messages/GetMessages",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Messages/GetMessages",
+            {
                 "CategoryID": category_id,
                 "Skip": skip,
                 "Take": take,
@@ -1334,8 +1257,6 @@ class User:
             },
         )
 
-        return _check_response_json(response)
-
     async def async_get_messages(
         self,
         category_id: int,
@@ -1383,16 +1304,9 @@ class User:
                 f"Parameter `take` must be of type `int`, but got value `{take}` of type `{type(take).__name__}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Contents/GetSupporters",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Contents/GetSupporters",
+            {
                 "ContentID": content_id,
                 "Category": category.value,
                 "Skip": skip,
@@ -1400,8 +1314,6 @@ class User:
             },
         )
 
-        return _check_response_json(response)
-
     async def async_get_supporters(
         self,
         content_id: str,
@@ -1458,16 +1370,9 @@ class User:
         else:
             errors.unreachable()
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Users/GetRelations",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Users/GetRelations",
+            {
                 "UserID": user_id,
                 "DisplayType": display_type_,
                 "Skip": skip,
@@ -1476,8 +1381,6 @@ class User:
             },
         )
 
-        return _check_response_json(response)
-
     async def async_get_relations(
         self,
         user_id: str,
@@ -1510,23 +1413,14 @@ class User:
                 f"Parameter `action` must be of type `bool`, but got value `{action}` of type `{type(action).__name__}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Users/Follow",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Users/Follow",
+            {
                 "TargetID": target_id,
-                "Action": int(action),
+                "Action": 1 if action else 0,
             },
         )
 
-        return _check_response_json(response)
-
     async def async_follow(
         self, target_id: str, action: bool = True
     ) -> Awaitable[dict]:
@@ -1547,23 +1441,14 @@ class User:
                 f"Parameter `nickname` must be of type `str`, but got value `{nickname}` of type {type(nickname).__name__}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Users/Rename",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Users/Rename",
+            {
                 "Target": nickname,
                 "UserID": self.user_id,
             },
         )
 
-        return _check_response_json(response)
-
     async def async_rename(self, nickname: str) -> Awaitable[dict]:
         """Execute the async rename routine."""
         return await _async_wrapper(self.rename, nickname)
@@ -1582,23 +1467,14 @@ class User:
                 f"Parameter `target` must be of type `str`, but got value `{target}` of type `{type(target).__name__}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Users/ModifyInformation",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Users/ModifyInformation",
+            {
                 "Target": target,
                 "Field": "Signature",
             },
         )
 
-        return _check_response_json(response)
-
     async def async_modify_information(self, target: str) -> Awaitable[dict]:
         """Execute the async modify information routine."""
         return await _async_wrapper(self.modify_information, target)
@@ -1626,24 +1502,15 @@ class User:
                 f"Parameter `index` must be a non-negative integer, but got value `{index}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Users/ReceiveBonus",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Users/ReceiveBonus",
+            {
                 "ActivityID": activity_id,
                 "Index": index,
                 "Statistic": self.statistic,
             },
         )
 
-        return _check_response_json(response)
-
     async def async_receive_bonus(
         self, activity_id: str, index: int
     ) -> Awaitable[dict]:
@@ -1677,24 +1544,15 @@ class User:
         if length <= 0:  # TODO Try negative number someday
             raise ValueError
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Users/Ban",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Users/Ban",
+            {
                 "TargetID": target_id,
                 "Reason": reason,
                 "Length": length,
             },
         )
 
-        return _check_response_json(response)
-
     async def async_ban(
         self, target_id: str, reason: str, length: int
     ) -> Awaitable[dict]:
@@ -1720,81 +1578,78 @@ class User:
                 f"Parameter reason must be of type `str`, but got value `{reason}` of type `{type(reason).__name__}`"
             )
 
-        response = _request.post_https(
-            domain=self.domain,
-            port=443,
-            path="Users/Unban",
-            header={
-                "Content-Type": "application/json",
-                "x-API-Token": _serialize_token(self.token),
-                "x-API-AuthCode": self.auth_code,
-            },
-            body={
+        return self._post(
+            "Users/Unban",
+            {
                 "TargetID": target_id,
                 "Reason": reason,
             },
         )
 
-        return _check_response_json(response)
-
     async def async_unban(self, target_id: str, reason: str) -> Awaitable[dict]:
         """Execute the async unban routine."""
         return await _async_wrapper(self.unban, target_id, reason)
 
 
-def anonymous_login(
-    domain: str = "physics-api-cn.turtlesim.com",
-) -> User:
-    """Anonymous login to Physics-Lab-AR"""
-    _version = quantum_physics.get_quantum_physics_version()
-    if _version is not None:
-        plar_version = int(f"{_version[0]}{_version[1]}{_version[2]}")
-    else:
-        plar_version = 2411
+# Device fingerprint every login reports to Users/Authenticate
+_LOGIN_DEVICE = {
+    "Identifier": "7db01528cf13e2199e141c402d79190e",
+    "Language": "Chinese",
+}
+
 
+def _login(
+    domain: str,
+    login: Optional[str],
+    password: Optional[str],
+    header: Dict[str, str],
+) -> User:
     response = _request.post_https(
         domain=domain,
         port=443,
         path="Users/Authenticate",
-        header={
-            "Content-Type": "application/json",
-        },
+        header=header,
         body={
-            "Login": None,
-            "Password": None,
-            "Version": plar_version,
-            "Device": {
-                "Identifier": "7db01528cf13e2199e141c402d79190e",
-                "Language": "Chinese",
-            },
+            "Login": login,
+            "Password": password,
+            "Version": quantum_physics.get_plar_version_number(),
+            "Device": _LOGIN_DEVICE,
         },
     )
 
     api_result = _check_response_json(response)
     assert api_result["AuthCode"] is not None, errors.BUG_REPORT
+    user_data = api_result["Data"]["User"]
     return User(
         token=api_result["Token"],
         auth_code=api_result["AuthCode"],
-        is_binded=api_result["Data"]["User"]["IsBinded"],
+        is_binded=user_data["IsBinded"],
         device_token=api_result["Data"]["DeviceToken"],
-        user_id=api_result["Data"]["User"]["ID"],
-        nickname=api_result["Data"]["User"]["Nickname"],
-        signature=api_result["Data"]["User"]["Signature"],
-        gold=api_result["Data"]["User"]["Gold"],
-        level=api_result["Data"]["User"]["Level"],
-        avatar=api_result["Data"]["User"]["Avatar"],
-        avatar_region=api_result["Data"]["User"]["AvatarRegion"],
-        decoration=api_result["Data"]["User"]["Decoration"],
-        verification=api_result["Data"]["User"]["Verification"],
+        user_id=user_data["ID"],
+        nickname=user_data["Nickname"],
+        signature=user_data["Signature"],
+        gold=user_data["Gold"],
+        level=user_data["Level"],
+        avatar=user_data["Avatar"],
+        avatar_region=user_data["AvatarRegion"],
+        decoration=user_data["Decoration"],
+        verification=user_data["Verification"],
         statistic=api_result["Data"]["Statistic"],
         domain=domain,
     )
 
 
+def anonymous_login(
+    domain: str = _API_DOMAIN,
+) -> User:
+    """Anonymous login to Physics-Lab-AR"""
+    return _login(domain, None, None, {"Content-Type": "application/json"})
+
+
 def email_login(
     email: str,
     password: str,
-    domain: str = "physics-api-cn.turtlesim.com",
+    domain: str = _API_DOMAIN,
 ) -> User:
     """Login to Physics-Lab-AR via email"""
     if not isinstance(email, str):
@@ -1806,55 +1661,13 @@ def email_login(
             f"Parameter password must be of type `str`, but got value {password} of type `{type(password).__name__}`"
         )
 
-    _version = quantum_physics.get_quantum_physics_version()
-    if _version is not None:
-        plar_version = int(f"{_version[0]}{_version[1]}{_version[2]}")
-    else:
-        plar_version = 2411
-
-    response = _request.post_https(
-        domain=domain,
-        port=443,
-        path="Users/Authenticate",
-        header={
-            "Content-Type": "application/json",
-        },
-        body={
-            "Login": email,
-            "Password": password,
-            "Version": plar_version,
-            "Device": {
-                "Identifier": "7db01528cf13e2199e141c402d79190e",
-                "Language": "Chinese",
-            },
-        },
-    )
-
-    api_result = _check_response_json(response)
-    assert api_result["AuthCode"] is not None, errors.BUG_REPORT
-    return User(
-        token=api_result["Token"],
-        auth_code=api_result["AuthCode"],
-        is_binded=api_result["Data"]["User"]["IsBinded"],
-        device_token=api_result["Data"]["DeviceToken"],
-        user_id=api_result["Data"]["User"]["ID"],
-        nickname=api_result["Data"]["User"]["Nickname"],
-        signature=api_result["Data"]["User"]["Signature"],
-        gold=api_result["Data"]["User"]["Gold"],
-        level=api_result["Data"]["User"]["Level"],
-        avatar=api_result["Data"]["User"]["Avatar"],
-        avatar_region=api_result["Data"]["User"]["AvatarRegion"],
-        decoration=api_result["Data"]["User"]["Decoration"],
-        verification=api_result["Data"]["User"]["Verification"],
-        statistic=api_result["Data"]["Statistic"],
-        domain=domain,
-    )
+    return _login(domain, email, password, {"Content-Type": "application/json"})
 
 
 def token_login(
     token: str,
     auth_code: str,
-    domain: str = "physics-api-cn.turtlesim.com",
+    domain: str = _API_DOMAIN,
 ) -> User:
     """Login to Physics-Lab-AR via token"""
     if not isinstance(token, str):
@@ -1866,55 +1679,20 @@ def token_login(
             f"Parameter password must be of type `str`, but got value {auth_code} of type `{type(auth_code).__name__}`"
         )
 
-    _version = quantum_physics.get_quantum_physics_version()
-    if _version is not None:
-        plar_version = int(f"{_version[0]}{_version[1]}{_version[2]}")
-    else:
-        plar_version = 2411
-
-    response = _request.post_https(
-        domain=domain,
-        port=443,
-        path="Users/Authenticate",
-        header={
+    return _login(
+        domain,
+        None,
+        None,
+        {
             "Content-Type": "application/json",
             "x-API-Token": token,
             "x-API-AuthCode": auth_code,
         },
-        body={
-            "Login": None,
-            "Password": None,
-            "Version": plar_version,
-            "Device": {
-                "Identifier": "7db01528cf13e2199e141c402d79190e",
-                "Language": "Chinese",
-            },
-        },
-    )
-
-    api_result = _check_response_json(response)
-    assert api_result["AuthCode"] is not None, errors.BUG_REPORT
-    return User(
-        token=api_result["Token"],
-        auth_code=api_result["AuthCode"],
-        is_binded=api_result["Data"]["User"]["IsBinded"],
-        device_token=api_result["Data"]["DeviceToken"],
-        user_id=api_result["Data"]["User"]["ID"],
-        nickname=api_result["Data"]["User"]["Nickname"],
-        signature=api_result["Data"]["User"]["Signature"],
-        gold=api_result["Data"]["User"]["Gold"],
-        level=api_result["Data"]["User"]["Level"],
-        avatar=api_result["Data"]["User"]["Avatar"],
-        avatar_region=api_result["Data"]["User"]["AvatarRegion"],
-        decoration=api_result["Data"]["User"]["Decoration"],
-        verification=api_result["Data"]["User"]["Verification"],
-        statistic=api_result["Data"]["Statistic"],
-        domain=domain,
     )
 
 
 async def async_anonymous_login(
-    domain: str = "physics-api-cn.turtlesim.com",
+    domain: str = _API_DOMAIN,
 ) -> Awaitable[User]:
     """Execute the async anonymous login routine."""
     return await _async_wrapper(anonymous_login, domain)
@@ -1923,7 +1701,7 @@ async def async_anonymous_login(
 async def async_email_login(
     email: str,
     password: str,
-    domain: str = "physics-api-cn.turtlesim.com",
+    domain: str = _API_DOMAIN,
 ) -> Awaitable[User]:
     """Execute the async email login routine."""
     return await _async_wrapper(email_login, email, password, domain)
@@ -1932,7 +1710,7 @@ async def async_email_login(
 async def async_token_login(
     token: str,
     auth_code: str,
-    domain: str = "physics-api-cn.turtlesim.com",
+    domain: str = _API_DOMAIN,
 ) -> Awaitable[User]:
     """Execute the async token login routine."""
     return await _async_wrapper(token_login, token, auth_code, domain)
@@ -31,6 +31,7 @@ def _run_task(max_retry: Optional[int], func: Callable, *args, **kwargs):
                 urllib3.exceptions.MaxRetryError,
                 urllib3.exceptions.ConnectionError,
                 requests.exceptions.HTTPError,
+                requests.exceptions.ConnectionError,
             ):
                 continue
     else:
@@ -45,6 +46,7 @@ def _run_task(max_retry: Optional[int], func: Callable, *args, **kwargs):
                 urllib3.exceptions.MaxRetryError,
                 urllib3.exceptions.ConnectionError,
                 requests.exceptions.HTTPError,
+                requests.exceptions.ConnectionError,
             ):
                 continue
         raise errors.MaxRetryError("max retry reached")
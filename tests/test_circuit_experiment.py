@@ -62,6 +62,12 @@ class TestCircuitExperiment(unittest.TestCase):
         ) as expe:
             self.assertTrue(expe.introduction is None)
 
+    def test_summary_rejects_bool_experiment_type(self):
+        with crt_circuit_experiment("type-test") as expe:
+            with self.assertRaises(TypeError):
+                expe.summary.experiment_type = True
+            self.assertEqual(expe.summary.experiment_type, 0)
+
     def test_crt_and_remove_element(self):
         with crt_circuit_experiment(None) as expe:
             a = elements.LogicInput(Position(0, 0, 0), Rotation(0, 0, 180))
@@ -35,6 +35,11 @@ class TestWebApi(unittest.IsolatedAsyncioTestCase):
             tags=[Tag.Featured], category=Category.Experiment
         )
 
+    async def test_query_experiments_pages(self):
+        await _user.user.async_query_experiments_pages(
+            category=Category.Experiment, total=40
+        )
+
     async def test_get_experiment(self):
         await _user.user.async_get_experiment(
             content_id="6317fabebfd18200013c710c", category=Category.Experiment
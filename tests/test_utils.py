@@ -1,12 +1,18 @@
+import asyncio
 import json
 import pathlib
 import tempfile
 import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import mock_open, patch
 
-from physicslab import constant, quantum_physics, utils
+import requests
+
+from physicslab import constant, errors, quantum_physics, utils
+from physicslab.enums import Category
 from physicslab.version import _Version
+from physicslab.web import _request, api, webutils
 from physicslab.web._threadpool import CanceledError, ThreadPool
 
 
@@ -38,6 +44,8 @@ class TestUtils(unittest.TestCase):
         "Windows-only constant is unavailable",
     )
     def test_get_quantum_physics_version_parses_numeric_segments(self):
+        quantum_physics.get_quantum_physics_version.cache_clear()
+        self.addCleanup(quantum_physics.get_quantum_physics_version.cache_clear)
         with patch("physicslab.quantum_physics.os.listdir", return_value=["a"]), patch(
             "builtins.open",
             mock_open(read_data=json.dumps({"app_ver": "1.2.3"})),
@@ -47,6 +55,207 @@ class TestUtils(unittest.TestCase):
                 (1, 2, 3),
             )
 
+    def test_get_quantum_physics_version_is_cached(self):
+        quantum_physics.get_quantum_physics_version.cache_clear()
+        self.addCleanup(quantum_physics.get_quantum_physics_version.cache_clear)
+        with patch(
+            "physicslab.quantum_physics.platform.system", return_value="Linux"
+        ) as system:
+            self.assertIsNone(quantum_physics.get_quantum_physics_version())
+            self.assertIsNone(quantum_physics.get_quantum_physics_version())
+
+        self.assertEqual(system.call_count, 1)
+
+    def test_get_plar_version_number_joins_version_segments(self):
+        with patch.object(
+            quantum_physics, "get_quantum_physics_version", return_value=(2, 4, 7)
+        ):
+            self.assertEqual(quantum_physics.get_plar_version_number(), 247)
+        with patch.object(
+            quantum_physics, "get_quantum_physics_version", return_value=None
+        ):
+            self.assertEqual(quantum_physics.get_plar_version_number(), 2411)
+
+    def test_get_avatar_raises_index_error_on_missing_image(self):
+        with patch.object(api._request, "get_raw") as get:
+            get.return_value.content = b"\xff\xd8image"
+            self.assertEqual(
+                api.get_avatar("5ce629e157035932b52f9315", 1, "users", "full"),
+                b"\xff\xd8image",
+            )
+            get.return_value.content = b'<?xml version="1.0"?><Error></Error>'
+            with self.assertRaises(IndexError):
+                api.get_avatar("5ce629e157035932b52f9315", 2, "users", "full")
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(
+            get.call_args[0][0],
+            "http://physics-static-cn.turtlesim.com:80"
+            "/users/avatars/5ce6/29/e1/57035932b52f9315/2.jpg!full",
+        )
+
+    def test_run_task_retries_exhausted_server_errors(self):
+        hits = []
+
+        class _Unavailable(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), _Unavailable)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        with patch("urllib3.util.retry.time.sleep"):
+            with self.assertRaises(errors.MaxRetryError):
+                webutils._run_task(
+                    1,
+                    _request.get_http,
+                    domain="127.0.0.1",
+                    path="avatar",
+                    port=server.server_port,
+                )
+
+        # 2 attempts by _run_task, each sending 1 request plus 3 adapter retries
+        self.assertEqual(len(hits), 8)
+
+    def test_shared_session_does_not_keep_cookies(self):
+        class _SetCookie(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Set-Cookie", "session=user-a; Path=/")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), _SetCookie)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        _request.get_http(domain="127.0.0.1", path="", port=server.server_port)
+
+        self.assertEqual(len(_request._session.cookies), 0)
+
+    def test_post_is_retried_on_rate_limit_only(self):
+        statuses = [429, 429, 200, 503]
+        hits = []
+
+        class _RateLimited(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                hits.append(self.path)
+                status = statuses.pop(0)
+                body = json.dumps({"Status": status}).encode("utf-8")
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", "1")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), _RateLimited)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        with patch("urllib3.util.retry.time.sleep") as sleep:
+            response = _request.post_http(
+                domain="127.0.0.1",
+                path="Users/GetUser",
+                header={"Content-Type": "application/json"},
+                body={},
+                port=server.server_port,
+            )
+            self.assertEqual(response, {"Status": 200})
+            self.assertEqual(len(hits), 3)
+            sleep.assert_called_with(1)
+
+            # a 5xx may arrive after the server acted, so the POST is not re-sent
+            with self.assertRaises(requests.HTTPError):
+                _request.post_http(
+                    domain="127.0.0.1",
+                    path="Users/GetUser",
+                    header={"Content-Type": "application/json"},
+                    body={},
+                    port=server.server_port,
+                )
+            self.assertEqual(len(hits), 4)
+
+    def test_async_query_experiments_pages_splits_total_into_pages(self):
+        user = api.User(
+            token=None,
+            auth_code="auth",
+            is_binded=False,
+            device_token=None,
+            user_id="0" * 24,
+            nickname=None,
+            signature=None,
+            gold=0,
+            level=0,
+            avatar=0,
+            avatar_region=0,
+            decoration=0,
+            verification=None,
+            statistic={},
+            domain="physics-api-cn.turtlesim.com",
+        )
+        calls = []
+
+        def query_experiments(
+            category,
+            tags=None,
+            exclude_tags=None,
+            languages=None,
+            exclude_languages=None,
+            user_id=None,
+            take=20,
+            skip=0,
+            from_skip=None,
+        ):
+            calls.append((take, skip))
+            return {"Data": {"$values": list(range(skip, skip + take))}}
+
+        with patch.object(api.User, "query_experiments", side_effect=query_experiments):
+            result = asyncio.run(
+                user.async_query_experiments_pages(Category.Experiment, total=45)
+            )
+            self.assertEqual(
+                sorted(calls, key=lambda call: call[1]), [(20, 0), (20, 20), (5, 40)]
+            )
+            self.assertEqual(result, list(range(45)))
+
+            calls.clear()
+            self.assertEqual(
+                asyncio.run(
+                    user.async_query_experiments_pages(Category.Experiment, total=0)
+                ),
+                [],
+            )
+            self.assertEqual(calls, [])
+
+            with self.assertRaises(ValueError):
+                asyncio.run(
+                    user.async_query_experiments_pages(
+                        Category.Experiment, total=45, page=0
+                    )
+                )
+            with self.assertRaises(ValueError):
+                asyncio.run(
+                    user.async_query_experiments_pages(Category.Experiment, total=-1)
+                )
+
     def test_find_path_of_sav_name_skips_invalid_json_files(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = pathlib.Path(tmp_dir)